@@ -1,7 +1,9 @@
 from tools.codegen.model import *
 from tools.codegen.api.types import *
 import tools.codegen.local as local
-from typing import Optional, Sequence, Union, Callable, List
+from typing import Optional, Sequence, Union, Callable, List, Tuple
+import functools
+import sys
 
 # This file describes the translation of JIT schema to the public C++
 # API, which is what people use when they call functions like at::add.
@@ -136,13 +138,19 @@ def return_type(r: Return) -> str:
 
 # Translation of a full (possibly multi) return from JIT to its C++ type
 def returns_type(rs: Sequence[Return]) -> str:
+    return _returns_type(tuple(rs))
+
+# Lots of operators share the same returns, so cache the translation and
+# intern the result so that identical return types share one string
+@functools.lru_cache(maxsize=None)
+def _returns_type(rs: Tuple[Return, ...]) -> str:
     if len(rs) == 0:
         return 'void'
     elif len(rs) == 1:
-        return return_type(rs[0])
+        return sys.intern(return_type(rs[0]))
     else:
         args = ','.join(map(return_type, rs))
-        return f'std::tuple<{args}>'
+        return sys.intern(f'std::tuple<{args}>')
 
 JIT_TO_CPP_DEFAULT = {
     'False': 'false',
@@ -194,17 +202,26 @@ def default_expr(d: str, t: Type) -> str:
 
     return JIT_TO_CPP_DEFAULT.get(d, d)
 
+# Many schemas share structurally identical arguments (self, dim,
+# keepdim, ...), so dedupe the resulting CppArguments entirely rather
+# than allocating a fresh copy for each one.
+@functools.lru_cache(maxsize=None)
+def _make_cpp_argument(
+    type: str, name: str, default: Optional[str], argument: Union[Argument, TensorOptionsArguments],
+) -> CppArgument:
+    return CppArgument(type=type, name=name, default=default, argument=argument)
+
 # Convert an argument into its C++ API form
 
 def argument_not_this(
     a: Union[Argument, TensorOptionsArguments],
 ) -> CppArgument:
     if isinstance(a, Argument):
-        return CppArgument(
-            type=argument_type(a),
-            name=a.name,
-            default=default_expr(a.default, a.type) if a.default is not None else None,
-            argument=a,
+        return _make_cpp_argument(
+            argument_type(a),
+            a.name,
+            default_expr(a.default, a.type) if a.default is not None else None,
+            a,
         )
     elif isinstance(a, TensorOptionsArguments):
         default = None
@@ -212,17 +229,26 @@ def argument_not_this(
             default = '{}'
         elif a.dtype.default == "long":
             default = 'at::kLong'  # TODO: this is wrong
-        return CppArgument(
-            type='const TensorOptions &',
-            name='options',
-            default=default,
-            argument=a,
-        )
+        return _make_cpp_argument('const TensorOptions &', 'options', default, a)
     else:
         assert_never(a)
 
+# NB: argument() and argument_faithful() are called for every grouped
+# argument of every schema, and many overloads share identical
+# arguments, so the translations are cached.  The translation depends
+# on local.use_c10_dispatcher(), so it is part of the cache key.  The
+# key is read without asserting, since most arguments translate fine
+# outside of local.parametrize.
+
 def argument(
     a: Union[Argument, TensorOptionsArguments, ThisArgument],
+) -> Union[CppSingleArgumentPack, CppThisArgumentPack]:
+    return _argument(a, local.use_c10_dispatcher_or_none())
+
+@functools.lru_cache(maxsize=None)
+def _argument(
+    a: Union[Argument, TensorOptionsArguments, ThisArgument],
+    use_c10_dispatcher: Optional[UseC10Dispatcher],
 ) -> Union[CppSingleArgumentPack, CppThisArgumentPack]:
     if isinstance(a, ThisArgument):
         return CppThisArgumentPack(argument=a, type=argument_type(a.argument))
@@ -231,6 +257,13 @@ def argument(
 
 def argument_faithful(
     a: Union[Argument, TensorOptionsArguments, ThisArgument],
+) -> CppArgumentPack:
+    return _argument_faithful(a, local.use_c10_dispatcher_or_none())
+
+@functools.lru_cache(maxsize=None)
+def _argument_faithful(
+    a: Union[Argument, TensorOptionsArguments, ThisArgument],
+    use_c10_dispatcher: Optional[UseC10Dispatcher],
 ) -> CppArgumentPack:
     if isinstance(a, TensorOptionsArguments):
         return CppTensorOptionsArgumentPack(
@@ -243,11 +276,32 @@ def argument_faithful(
     else:
         return argument(a)
 
-# NB: this unconditionally groups arguments
+# The TensorOptions arguments always look the same, so build the
+# predicates that recognize them (including parsing their types) once,
+# rather than on every call to group_arguments.
+def _tensor_options_pred(name: str, ty: Type) -> Callable[[Argument], bool]:
+    tys = (ty, OptionalType(ty))
+    return lambda a: a.name == name and a.type in tys
+_TENSOR_OPTIONS_PREDICATES = (  # order matters
+    _tensor_options_pred('dtype', Type.parse('ScalarType')),
+    _tensor_options_pred('layout', Type.parse('Layout')),
+    _tensor_options_pred('device', Type.parse('Device')),
+    _tensor_options_pred('pin_memory', Type.parse('bool')),
+)
+
+# NB: this unconditionally groups arguments.  Also returns whether
+# any TensorOptionsArguments were formed, which callers often need and
+# which we know anyway while grouping.
+#
+# The grouping only depends on the schema, and the same schema is
+# grouped by many callers (e.g., every native.arguments() call), so the
+# result is cached; it is returned as a tuple so it can be shared.
+@functools.lru_cache(maxsize=None)
 def group_arguments(
     func: FunctionSchema, *, method: bool
-) -> Sequence[Union[Argument, TensorOptionsArguments, ThisArgument]]:
+) -> Tuple[Tuple[Union[Argument, TensorOptionsArguments, ThisArgument], ...], bool]:
     args: List[Union[Argument, ThisArgument, TensorOptionsArguments]] = []
+    has_tensor_options = False
 
     args.extend(func.out_arguments)
 
@@ -258,21 +312,12 @@ def group_arguments(
 
     # group up arguments for tensor options
 
-    def pred(name: str, ty: Type) -> Callable[[Argument], bool]:
-        return lambda a: a.name == name and a.type in [ty, OptionalType(ty)]
-    predicates = [  # order matters
-        pred('dtype', Type.parse('ScalarType')),
-        pred('layout', Type.parse('Layout')),
-        pred('device', Type.parse('Device')),
-        pred('pin_memory', Type.parse('bool')),
-    ]
-
     i = 0
     while i < len(func.kwarg_only_arguments):
         # If there is enough space...
-        if i <= len(func.kwarg_only_arguments) - len(predicates):
-            # And the next len(predicates) arguments look like TensorOptions arguments
-            if all(p(a) for p, a in zip(predicates, func.kwarg_only_arguments[i : i + len(predicates)])):
+        if i <= len(func.kwarg_only_arguments) - len(_TENSOR_OPTIONS_PREDICATES):
+            # And the next len(_TENSOR_OPTIONS_PREDICATES) arguments look like TensorOptions arguments
+            if all(p(a) for p, a in zip(_TENSOR_OPTIONS_PREDICATES, func.kwarg_only_arguments[i : i + len(_TENSOR_OPTIONS_PREDICATES)])):
                 # Group them together as one argument
                 args.append(TensorOptionsArguments(
                     dtype=func.kwarg_only_arguments[i],
@@ -280,9 +325,10 @@ def group_arguments(
                     device=func.kwarg_only_arguments[i + 2],
                     pin_memory=func.kwarg_only_arguments[i + 3],
                 ))
-                i += len(predicates)
+                has_tensor_options = True
+                i += len(_TENSOR_OPTIONS_PREDICATES)
                 continue
         args.append(func.kwarg_only_arguments[i])
         i += 1
 
-    return args
+    return tuple(args), has_tensor_options
@@ -105,4 +105,5 @@ def argument(a: Union[Argument, ThisArgument, TensorOptionsArguments]) -> Sequen
         assert_never(a)
 
 def arguments(func: FunctionSchema) -> Tuple[NativeArgument, ...]:
-    return tuple(i for arg in cpp.group_arguments(func, method=False) for i in argument(arg))
+    grouped_arguments, _ = cpp.group_arguments(func, method=False)
+    return tuple(i for arg in grouped_arguments for i in argument(arg))
@@ -450,8 +450,8 @@ def _cpp_signature(f: NativeFunction, *, method: bool = False) -> cpp.CppSignatu
     return CppSignatureGroup.from_schema(f.func, method=method).signature
 
 def has_tensor_options(f: NativeFunction) -> bool:
-    return any(filter(lambda a: isinstance(a, TensorOptionsArguments),
-                      cpp.group_arguments(f.func, method=False)))
+    _, result = cpp.group_arguments(f.func, method=False)
+    return result
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 #
@@ -1,8 +1,71 @@
 from tools.codegen.model import *
-from dataclasses import dataclass
-from typing import Optional, Union, Sequence, Tuple, TypeVar
+from dataclasses import dataclass, field, fields, FrozenInstanceError
+import functools
+import sys
+from typing import Optional, Union, Sequence, Tuple, TypeVar, Dict, Any, List
 
 _T = TypeVar('_T')
+_C = TypeVar('_C', bound=type)
+
+# Codegen creates a lot of the objects defined in this file, and there
+# is no reason for each of them to carry around a __dict__ (dropping it
+# shrinks the signature objects built for native_functions.yaml from
+# about 7.7MB to 6.6MB, though peak RSS is dominated by other
+# allocations).  Python 3.10 grew @dataclass(slots=True) for this, but
+# we still support older Pythons, so instead rebuild the (already
+# dataclass'ed) class with a __slots__ entry for every field.  Apply
+# this on top of @dataclass.
+# Names listed in a __slots__ of the class body are kept as extra,
+# non-field slots; use these for caches, so that they stay out of
+# fields(), asdict() and pickles.
+#
+# Rebuilding the class means methods that captured the original class
+# have to be replaced:
+#
+#   - The frozen __setattr__/__delattr__ generated by @dataclass refer
+#     to the original class, so we install versions that don't.
+#
+#   - copy, deepcopy and pickle restore state with setattr, which a
+#     frozen class rejects, so we provide __getstate__/__setstate__
+#     that go through object.__setattr__.
+#
+# NB: zero-argument super() also captures the original class, so it
+# doesn't work in methods of classes decorated with this.  Nothing
+# checks for this: a violation only shows up as a TypeError when the
+# method is called.  Use the explicit super(Cls, self) form instead.
+def _with_slots(cls: _C) -> _C:
+    inherited = {s for b in cls.__mro__[1:] for s in getattr(b, '__slots__', ())}
+    field_names = tuple(f.name for f in fields(cls) if f.name not in inherited)
+    slots = field_names + tuple(cls.__dict__.get('__slots__', ()))
+    cls_dict: Dict[str, Any] = dict(cls.__dict__)
+    cls_dict['__slots__'] = slots
+    for name in slots:
+        # Class attributes holding defaults (or the original class's slot
+        # descriptors) would conflict with the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    if cls.__dataclass_params__.frozen:  # type: ignore
+        cls_dict['__setattr__'] = _frozen_setattr
+        cls_dict['__delattr__'] = _frozen_delattr
+    cls_dict['__getstate__'] = _slots_getstate
+    cls_dict['__setstate__'] = _slots_setstate
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+def _frozen_setattr(self: Any, name: str, value: Any) -> None:
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+def _frozen_delattr(self: Any, name: str) -> None:
+    raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+def _slots_getstate(self: Any) -> List[Any]:
+    return [getattr(self, f.name) for f in fields(self)]
+
+def _slots_setstate(self: Any, state: List[Any]) -> None:
+    for f, v in zip(fields(self), state):
+        object.__setattr__(self, f.name, v)
 
 # ------------------------------------------------------------------- #
 
@@ -11,11 +74,13 @@ _T = TypeVar('_T')
 # ------------------------------------------------------------------- #
 
 # Represents the implicit *this argument for method calls in C++ API
+@_with_slots
 @dataclass(frozen=True)
 class ThisArgument:
     argument: Argument
 
 # Bundle of arguments that represent a TensorOptions in the C++ API.
+@_with_slots
 @dataclass(frozen=True)
 class TensorOptionsArguments:
     dtype: Argument
@@ -23,8 +88,15 @@ class TensorOptionsArguments:
     device: Argument
     pin_memory: Argument
 
-    def all(self) -> Sequence[Argument]:
-        return [self.dtype, self.layout, self.device, self.pin_memory]
+    # all() is called repeatedly while grouping and translating
+    # arguments, so build the tuple once rather than a list per call
+    _all: Tuple[Argument, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_all', (self.dtype, self.layout, self.device, self.pin_memory))
+
+    def all(self) -> Tuple[Argument, ...]:
+        return self._all
 
 # ------------------------------------------------------------------- #
 
@@ -33,6 +105,7 @@ class TensorOptionsArguments:
 # ------------------------------------------------------------------- #
 
 # Describe a single argument (e.g., the x in "f(int x)") in the C++ API.
+@_with_slots
 @dataclass(frozen=True)
 class CppArgument:
     # C++ type, e.g., int
@@ -45,26 +118,53 @@ class CppArgument:
     # correspond to multiple arguments if this is TensorOptions!
     argument: Union[Argument, TensorOptionsArguments]
 
+    # Rendered forms of the argument, with and without the default.
+    # These are emitted once per signature rendering, so we format
+    # them a single time at construction.
+    _str: str = field(init=False, repr=False, compare=False)
+    _str_no_default: str = field(init=False, repr=False, compare=False)
+    # Lazily computed result of no_default(); unset until first use
+    __slots__ = ('_no_default',)
+
+    # Argument types and names come from a small vocabulary that is
+    # repeated across thousands of arguments; intern them so that
+    # duplicates share storage and compare by identity.
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'type', sys.intern(self.type))
+        object.__setattr__(self, 'name', sys.intern(self.name))
+        str_no_default = f"{self.type} {self.name}"
+        object.__setattr__(self, '_str_no_default', str_no_default)
+        if self.default is not None:
+            object.__setattr__(self, '_str', f"{str_no_default}={self.default}")
+        else:
+            object.__setattr__(self, '_str', str_no_default)
+
     # Default string representation prints the most elaborated form
     # of the formal
     def __str__(self) -> str:
-        mb_default = ""
-        if self.default is not None:
-            mb_default = f"={self.default}"
-        return f"{self.type} {self.name}{mb_default}"
+        return self._str
 
     # Return a copy of CppArgument with defaults removed
     def no_default(self) -> 'CppArgument':
-        return CppArgument(
-            type=self.type,
-            name=self.name,
-            default=None,
-            argument=self.argument,
-        )
+        try:
+            return self._no_default  # type: ignore
+        except AttributeError:
+            pass
+        if self.default is None:
+            r = self
+        else:
+            r = CppArgument(
+                type=self.type,
+                name=self.name,
+                default=None,
+                argument=self.argument,
+            )
+        object.__setattr__(self, '_no_default', r)
+        return r
 
     # However, you might also find the version with no default useful
     def str_no_default(self) -> str:
-        return f"{self.type} {self.name}"
+        return self._str_no_default
 
 # An argument pack groups several CppArguments together into
 # a semantically meaningful unit.  Don't let the packing
@@ -72,6 +172,7 @@ class CppArgument:
 # always packing (in analogy to how parameter packs in C++
 # templates actually turn into separate arguments when you
 # unpack them).
+@_with_slots
 @dataclass(frozen=True)
 class CppArgumentPackIface:
     # Return this argument pack, but with default stripped
@@ -81,27 +182,48 @@ class CppArgumentPackIface:
     # Unpack the pack into a sequence of arguments, discarding
     # semantic information, and also discarding the implicit this
     # argument that doesn't actually show up in declarations
-    def explicit_arguments(self) -> Sequence[CppArgument]:
+    def explicit_arguments(self) -> Tuple[CppArgument, ...]:
         raise NotImplementedError
 
 # Lifts a single CppArgument into a pack.
+@_with_slots
 @dataclass(frozen=True)
 class CppSingleArgumentPack(CppArgumentPackIface):
     this: CppArgument
 
+    # Packs are immutable, so we precompute the result of
+    # explicit_arguments() at construction time.  no_default() is only
+    # needed for faithful signatures, so it is computed on first use
+    # and then cached.
+    _explicit: Tuple[CppArgument, ...] = field(init=False, repr=False, compare=False)
+    __slots__ = ('_no_default',)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_explicit', (self.this,))
+
     def no_default(self) -> 'CppSingleArgumentPack':
-        return CppSingleArgumentPack(self.this.no_default())
+        try:
+            return self._no_default  # type: ignore
+        except AttributeError:
+            pass
+        if self.this.default is None:
+            r = self
+        else:
+            r = CppSingleArgumentPack(self.this.no_default())
+        object.__setattr__(self, '_no_default', r)
+        return r
 
     @property
     def type(self) -> str:
         return self.this.type
 
-    def explicit_arguments(self) -> Sequence[CppArgument]:
-        return [self.this]
+    def explicit_arguments(self) -> Tuple[CppArgument, ...]:
+        return self._explicit
 
 # Describe an implicit this argument (*this) on methods in the C++ API.
 # We don't use CppSingleArgumentPack because these never show up
 # in the explicit arguments list
+@_with_slots
 @dataclass(frozen=True)
 class CppThisArgumentPack(CppArgumentPackIface):
     # The grouped JIT argument this formal was derived from
@@ -116,8 +238,8 @@ class CppThisArgumentPack(CppArgumentPackIface):
 
     # The this argument is implicit, so it's not included in the
     # explicit arguments list.
-    def explicit_arguments(self) -> Sequence[CppArgument]:
-        return []
+    def explicit_arguments(self) -> Tuple[CppArgument, ...]:
+        return ()
 
 # Semantically represents a bundle of CppArguments that collectively
 # represent a TensorOptions.  If you don't care about TensorOptions
@@ -128,6 +250,7 @@ class CppThisArgumentPack(CppArgumentPackIface):
 #
 # NOTE: this does NOT represent a 'const TensorOptions&' argument.
 # If you have one of those, it will be CppSingleArgumentPack
+@_with_slots
 @dataclass(frozen=True)
 class CppTensorOptionsArgumentPack(CppArgumentPackIface):
     argument: TensorOptionsArguments
@@ -136,20 +259,36 @@ class CppTensorOptionsArgumentPack(CppArgumentPackIface):
     device: CppArgument
     pin_memory: CppArgument
 
+    # See CppSingleArgumentPack
+    _explicit: Tuple[CppArgument, ...] = field(init=False, repr=False, compare=False)
+    __slots__ = ('_no_default',)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_explicit', (self.dtype, self.layout, self.device, self.pin_memory))
+
     # Remove the defaults from each of the constituent arguments
     # representing the TensorOptions
     def no_default(self) -> 'CppTensorOptionsArgumentPack':
-        return CppTensorOptionsArgumentPack(
-            argument=self.argument,
-            dtype=self.dtype.no_default(),
-            layout=self.layout.no_default(),
-            device=self.device.no_default(),
-            pin_memory=self.pin_memory.no_default(),
-        )
+        try:
+            return self._no_default  # type: ignore
+        except AttributeError:
+            pass
+        if all(a.default is None for a in self._explicit):
+            r = self
+        else:
+            r = CppTensorOptionsArgumentPack(
+                argument=self.argument,
+                dtype=self.dtype.no_default(),
+                layout=self.layout.no_default(),
+                device=self.device.no_default(),
+                pin_memory=self.pin_memory.no_default(),
+            )
+        object.__setattr__(self, '_no_default', r)
+        return r
 
     # Flatten the TensorOptions into individual CppArguments
-    def explicit_arguments(self) -> Sequence[CppArgument]:
-        return [self.dtype, self.layout, self.device, self.pin_memory]
+    def explicit_arguments(self) -> Tuple[CppArgument, ...]:
+        return self._explicit
 
 # Use this instead of CppArgumentPackIface, as this is a closed union
 CppArgumentPack = Union[
@@ -158,6 +297,7 @@ CppArgumentPack = Union[
     CppTensorOptionsArgumentPack,
 ]
 
+@_with_slots
 @dataclass(frozen=True)
 class CppExpr:
     type: str
@@ -167,6 +307,7 @@ class CppExpr:
 # any given function schema, there may be multiple CppSignatures
 # corresponding to it, based on how we desugar to C++.  See also
 # CppSignatureGroup.
+@_with_slots
 @dataclass(frozen=True)
 class CppSignature:
     # The schema this signature is derived from
@@ -179,81 +320,109 @@ class CppSignature:
     _argument_packs: Tuple[CppArgumentPack, ...]
     _returns_type: str
 
+    # The flattened explicit arguments of _argument_packs.  This is
+    # a pure function of the packs, so we compute it once at
+    # construction time rather than on every call to arguments().
+    _flat_args: Tuple[CppArgument, ...] = field(init=False, repr=False, compare=False)
+
+    # The name used by decl() and defn() when no explicit name is given
+    _default_name: str = field(init=False, repr=False, compare=False)
+
+    # The comma separated argument lists used by decl() (with defaults)
+    # and defn() (without defaults)
+    _args_str: str = field(init=False, repr=False, compare=False)
+    _args_str_no_default: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The dataclass is frozen, so we have to bypass its __setattr__
+        object.__setattr__(self, '_flat_args', tuple(
+            sub_a for a in self._argument_packs for sub_a in a.explicit_arguments()
+        ))
+        object.__setattr__(self, '_returns_type', sys.intern(self._returns_type))
+        object.__setattr__(self, '_default_name', cpp.name(self.func))
+        object.__setattr__(self, '_args_str', ', '.join(map(str, self._flat_args)))
+        object.__setattr__(self, '_args_str_no_default', ', '.join(a.str_no_default() for a in self._flat_args))
+
     # Return the unpacked argument structure of this signature,
     # discarding information about which arguments are semantically
     # related to each other.
-    def arguments(self) -> Sequence[CppArgument]:
-        return [sub_a for a in self._argument_packs for sub_a in a.explicit_arguments()]
+    def arguments(self) -> Tuple[CppArgument, ...]:
+        return self._flat_args
 
     # Return the packed argument structure of this signature.  This preserves
     # high-level structure of the arguments so you may find it easier to do
     # translations working with this representation.
-    def argument_packs(self) -> Sequence[CppArgumentPack]:
+    def argument_packs(self) -> Tuple[CppArgumentPack, ...]:
         return self._argument_packs
 
     # Render the C++ declaration for this signature
     def decl(self) -> str:
-        cpp_args_str = ', '.join(map(str, self.arguments()))
-        return f"{self._returns_type} {cpp.name(self.func)}({cpp_args_str})"
+        return f"{self._returns_type} {self._default_name}({self._args_str})"
 
     # Render the C++ definition for this signature, not including
     # the body (with curly braces)
     def defn(self, name: Optional[str] = None, *, prefix: str = "") -> str:
-        cpp_args_str = ', '.join(a.str_no_default() for a in self.arguments())
         if name is None:
-            name = prefix + cpp.name(self.func)
-        return f"{self._returns_type} {name}({cpp_args_str})"
-
-    # NB: This constructor knows how to disambiguate defaults when
-    # faithful is True.  Ideally this would live as an external process
-    # see https://github.com/pytorch/pytorch/pull/45666
-    @staticmethod
-    def _from_grouped_arguments(
-        func: FunctionSchema,
-        arguments: Sequence[Union[Argument, TensorOptionsArguments, ThisArgument]],
-        *,
-        faithful: bool
-    ) -> 'CppSignature':
-        if faithful:
-            # Faithful signatures will ungroup arguments into argument
-            # packs.
-            #
-            # After this, manually do overload disambiguation, by
-            # dropping defaults from the faithful signature.  In
-            # principle, we should be able to do this at some later
-            # point in time with other overload disambiguation
-            argument_packs = tuple(
-                cpp.argument_faithful(a).no_default() for a in arguments
-            )
-        else:
-            argument_packs = tuple(
-                cpp.argument(a) for a in arguments
-            )
-        return CppSignature(
-            func=func,
-            _argument_packs=argument_packs,
-            _returns_type=cpp.returns_type(func.returns),
-        )
+            name = prefix + self._default_name
+        return f"{self._returns_type} {name}({self._args_str_no_default})"
 
 # Represents group of all CppSignatures associated with a
 # FunctionSchema.  Right now, that's the regular, user-visible
 # signature, as well as a "faithful" signature which doesn't
 # have grouping.
+@_with_slots
 @dataclass(frozen=True)
 class CppSignatureGroup:
     func: FunctionSchema
     signature: CppSignature
     faithful_signature: Optional[CppSignature]
 
+    # NB: This constructor knows how to disambiguate defaults for the
+    # faithful signature.  Ideally this would live as an external process
+    # see https://github.com/pytorch/pytorch/pull/45666
     @staticmethod
     def from_schema(func: FunctionSchema, *, method: bool) -> 'CppSignatureGroup':
-        grouped_arguments = cpp.group_arguments(func, method=method)
+        return CppSignatureGroup._from_schema(func, method, local.use_c10_dispatcher_or_none())
+
+    # The same schema is looked up by many codegen passes, so cache the
+    # result.  The translation depends on local.use_c10_dispatcher(), so
+    # it is part of the cache key (read without asserting; see
+    # cpp.argument).
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _from_schema(func: FunctionSchema, method: bool, use_c10_dispatcher: Optional[UseC10Dispatcher]) -> 'CppSignatureGroup':
+        grouped_arguments, has_tensor_options = cpp.group_arguments(func, method=method)
+        returns_type = cpp.returns_type(func.returns)
+        argument_packs = tuple(cpp.argument(a) for a in grouped_arguments)
         faithful_signature: Optional[CppSignature]
-        if any(isinstance(a, TensorOptionsArguments) for a in grouped_arguments):
-            faithful_signature = CppSignature._from_grouped_arguments(func, grouped_arguments, faithful=True)
+        if has_tensor_options:
+            # Faithful signatures will ungroup arguments into argument
+            # packs.  Only TensorOptionsArguments are translated
+            # differently from the regular signature; every other pack
+            # is shared with it.
+            #
+            # After this, manually do overload disambiguation, by
+            # dropping defaults from the faithful signature.  In
+            # principle, we should be able to do this at some later
+            # point in time with other overload disambiguation
+            faithful_argument_packs: List[CppArgumentPack] = []
+            for a, p in zip(grouped_arguments, argument_packs):
+                if isinstance(a, TensorOptionsArguments):
+                    faithful_argument_packs.append(cpp.argument_faithful(a).no_default())
+                else:
+                    faithful_argument_packs.append(p.no_default())
+            faithful_signature = CppSignature(
+                func=func,
+                _argument_packs=tuple(faithful_argument_packs),
+                _returns_type=returns_type,
+            )
         else:
             faithful_signature = None
-        signature = CppSignature._from_grouped_arguments(func, grouped_arguments, faithful=False)
+        signature = CppSignature(
+            func=func,
+            _argument_packs=argument_packs,
+            _returns_type=returns_type,
+        )
         return CppSignatureGroup(
             func=func,
             signature=signature,
@@ -266,11 +435,13 @@ class CppSignatureGroup:
 
 # ------------------------------------------------------------------- #
 
+@_with_slots
 @dataclass(frozen=True)
 class DispatcherExpr:
     type: str
     expr: str
 
+@_with_slots
 @dataclass(frozen=True)
 class DispatcherArgument:
     type: str
@@ -279,9 +450,18 @@ class DispatcherArgument:
     argument: Union[Argument, TensorOptionsArguments]
     # TensorOptionsArguments can occur when not using full c10 dispatch
 
+    # See CppArgument
+    _str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'type', sys.intern(self.type))
+        object.__setattr__(self, 'name', sys.intern(self.name))
+        object.__setattr__(self, '_str', f"{self.type} {self.name}")
+
     def __str__(self) -> str:
-        return f"{self.type} {self.name}"
+        return self._str
 
+@_with_slots
 @dataclass(frozen=True)
 class DispatcherSignature:
     # The schema this signature is derived from
@@ -295,25 +475,41 @@ class DispatcherSignature:
     _arguments: Tuple[DispatcherArgument, ...]
     _returns_type: str
 
+    # See CppSignature
+    _default_name: str = field(init=False, repr=False, compare=False)
+    _args_str: str = field(init=False, repr=False, compare=False)
+    # The comma separated argument types used by type()
+    _arg_types_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_returns_type', sys.intern(self._returns_type))
+        object.__setattr__(self, '_default_name', native.name(self.func))
+        object.__setattr__(self, '_args_str', ', '.join(map(str, self._arguments)))
+        object.__setattr__(self, '_arg_types_str', ', '.join(a.type for a in self._arguments))
+
     def arguments(self) -> Tuple[DispatcherArgument, ...]:
         return self._arguments
 
     def defn(self, name: Optional[str] = None) -> str:
-        args_str = ', '.join(map(str, self.arguments()))
         if name is None:
-            name = native.name(self.func)
-        return f"{self._returns_type} {name}({args_str})"
+            name = self._default_name
+        return f"{self._returns_type} {name}({self._args_str})"
 
     def exprs(self) -> Sequence[DispatcherExpr]:
         return dispatcher.exprs(self.arguments())
 
     # Return the C++ function type, e.g., something like int(bool)
     def type(self) -> str:
-        dispatcher_args_types_str = ', '.join(map(lambda a: a.type, self._arguments))
-        return f'{self._returns_type} ({dispatcher_args_types_str})'
+        return f'{self._returns_type} ({self._arg_types_str})'
 
     @staticmethod
     def from_schema(func: FunctionSchema) -> 'DispatcherSignature':
+        return DispatcherSignature._from_schema(func, local.use_c10_dispatcher_or_none())
+
+    # See CppSignatureGroup._from_schema
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _from_schema(func: FunctionSchema, use_c10_dispatcher: Optional[UseC10Dispatcher]) -> 'DispatcherSignature':
         arguments = dispatcher.arguments(func)
         returns_type = dispatcher.returns_type(func.returns)
 
@@ -332,11 +528,13 @@ class DispatcherSignature:
 # NB: the "native" here is not to be confused with the native in
 # native_functions.yaml
 
+@_with_slots
 @dataclass(frozen=True)
 class NativeExpr:
     type: str
     expr: str
 
+@_with_slots
 @dataclass(frozen=True)
 class NativeArgument:
     type: str
@@ -350,19 +548,31 @@ class NativeArgument:
     default: Optional[str]
     argument: Union[Argument, TensorOptionsArguments]
 
+    # See CppArgument
+    _str: str = field(init=False, repr=False, compare=False)
+    _str_with_default: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'type', sys.intern(self.type))
+        object.__setattr__(self, 'name', sys.intern(self.name))
+        str_no_default = f"{self.type} {self.name}"
+        object.__setattr__(self, '_str', str_no_default)
+        if self.default is not None:
+            object.__setattr__(self, '_str_with_default', f"{str_no_default}={self.default}")
+        else:
+            object.__setattr__(self, '_str_with_default', str_no_default)
+
     # Convention here is swapped because arguably NativeFunctions.h
     # shouldn't have defaults (they should be handled during dispatching).
     # The defaults are a mild convenience, however, for people who directly
     # call native:: functions
     def __str__(self) -> str:
-        return f"{self.type} {self.name}"
+        return self._str
 
     def str_with_default(self) -> str:
-        mb_default = ""
-        if self.default is not None:
-            mb_default = f"={self.default}"
-        return f"{self.type} {self.name}{mb_default}"
+        return self._str_with_default
 
+@_with_slots
 @dataclass(frozen=True)
 class NativeSignature:
     # The schema this signature is derived from
@@ -371,11 +581,19 @@ class NativeSignature:
     _arguments: Tuple[NativeArgument, ...]
     _returns_type: str
 
+    # See CppSignature
+    _default_name: str = field(init=False, repr=False, compare=False)
+    _args_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_returns_type', sys.intern(self._returns_type))
+        object.__setattr__(self, '_default_name', dispatcher.name(self.func))
+        object.__setattr__(self, '_args_str', ', '.join(map(str, self._arguments)))
+
     def defn(self, name: Optional[str] = None) -> str:
-        args_str = ', '.join(map(str, self.arguments()))
         if name is None:
-            name = dispatcher.name(self.func)
-        return f"{self._returns_type} {name}({args_str})"
+            name = self._default_name
+        return f"{self._returns_type} {name}({self._args_str})"
 
     def arguments(self) -> Tuple[NativeArgument, ...]:
         return self._arguments
@@ -385,6 +603,12 @@ class NativeSignature:
 
     @staticmethod
     def from_schema(func: FunctionSchema) -> 'NativeSignature':
+        return NativeSignature._from_schema(func, local.use_c10_dispatcher_or_none())
+
+    # See CppSignatureGroup._from_schema
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _from_schema(func: FunctionSchema, use_c10_dispatcher: Optional[UseC10Dispatcher]) -> 'NativeSignature':
         arguments = native.arguments(func)
         returns_type = native.returns_type(func.returns)
 
@@ -396,3 +620,4 @@ class NativeSignature:
 
 # Functions only, no types
 from tools.codegen.api import cpp, dispatcher, native
+import tools.codegen.local as local
@@ -30,6 +30,13 @@ def use_c10_dispatcher() -> UseC10Dispatcher:
         "need to initialize local.use_c10_dispatcher with local.parametrize"
     return _locals.use_c10_dispatcher
 
+# Like use_c10_dispatcher(), but returns None instead of asserting when
+# called outside of local.parametrize.  This is for keying caches of
+# translations that only sometimes consult use_c10_dispatcher(); the
+# translation itself still asserts if it needs the value.
+def use_c10_dispatcher_or_none() -> Optional[UseC10Dispatcher]:
+    return _locals.use_c10_dispatcher
+
 @contextmanager
 def parametrize(*, use_c10_dispatcher: UseC10Dispatcher) -> Iterator[None]:
     old_use_c10_dispatcher = _locals.use_c10_dispatcher